@@ -1,8 +1,14 @@
-from src.pdf_processor import PDFProcessor
+import sys
 from pathlib import Path
-import json
 
-processor = PDFProcessor()
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from pdf_processor import PDFProcessor
+from outline_cache import OutlineCache
+
+# Cache outlines on disk so repeated analysis runs skip re-parsing
+processor = OutlineCache(PDFProcessor())
 
 # Test current vs expected outputs
 files_to_check = ['file01.pdf', 'file02.pdf', 'file03.pdf', 'file04.pdf', 'file05.pdf']
@@ -1,3 +1,4 @@
+import heapq
 import fitz
 from src.pdf_processor import PDFProcessor
 
@@ -9,21 +10,26 @@ print('PDF Metadata:')
 print(doc.metadata)
 print()
 
+def iter_text_spans(blocks):
+    """Yield (y_pos, size, text) for each span with more than 5 characters."""
+    for block in blocks.get('blocks', []):
+        if 'lines' not in block:
+            continue
+        for line in block['lines']:
+            y_pos = line['bbox'][1]
+            for span in line.get('spans', []):
+                text = span.get('text', '').strip()
+                if len(text) > 5:
+                    yield y_pos, span.get('size', 0), text
+
 # Check first page text extraction
 page = doc[0]
-print('Page text analysis:')
-blocks = page.get_text('dict')
-for block in blocks.get('blocks', []):
-    if 'lines' not in block:
-        continue
-    for line in block['lines']:
-        y_pos = line.get('bbox', [0, 0, 0, 0])[1] 
-        page_height = page.rect.height
-        for span in line.get('spans', []):
-            text = span.get('text', '').strip()
-            size = span.get('size', 0)
-            if text and len(text) > 5:
-                print(f'Y: {y_pos}/{page_height} ({y_pos/page_height*100:.1f}%) | Size: {size} | Text: "{text}"')
+print('Page text analysis (10 largest spans):')
+# Image blocks carry no text, so skip building them
+blocks = page.get_text('dict', flags=fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES)
+page_height = page.rect.height
+for y_pos, size, text in heapq.nlargest(10, iter_text_spans(blocks), key=lambda span: span[1]):
+    print(f'Y: {y_pos}/{page_height} ({y_pos/page_height*100:.1f}%) | Size: {size} | Text: "{text}"')
 
 # Test the looks_like_filename method
 title_from_metadata = doc.metadata.get('title', '')
@@ -4,16 +4,20 @@ Local PDF Outline Extractor - Main Application
 Extracts structured document outlines from PDF files in local directories.
 """
 
+import io
 import os
-import json
 import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, Any
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from pdf_processor import PDFProcessor
+from json_io import COMPACT_OUTLINE, pack_result, write_json
+from outline_cache import OutlineCache
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +29,49 @@ logger = logging.getLogger(__name__)
 INPUT_DIR = Path("input")
 OUTPUT_DIR = Path("output")
 
+# PDF processor reused by every task in a worker process (set by _init_worker)
+_PROCESSOR = None
+
+def _init_worker():
+    """Create the worker process's PDF processor once, before it runs any tasks."""
+    global _PROCESSOR
+    _PROCESSOR = OutlineCache(PDFProcessor())
+
+def process_one(pdf_file: Path) -> Dict[str, Any]:
+    """
+    Extract the outline of a single PDF and write its JSON output.
+    
+    Runs in a worker process; the returned summary is reported by the parent.
+    
+    Args:
+        pdf_file: Path to PDF file
+        
+    Returns:
+        Summary dictionary with the output path and either the result or an error
+    """
+    output_file = OUTPUT_DIR / f"{pdf_file.stem}.json"
+    
+    try:
+        # Extract outline, reusing cached results from earlier runs
+        result = _PROCESSOR.extract_outline(pdf_file)
+        
+        # Write JSON output
+        write_json(pack_result(result) if COMPACT_OUTLINE else result, output_file)
+        
+        return {"pdf_name": pdf_file.name, "output_file": output_file, "result": result}
+        
+    except Exception as e:
+        # Create error output
+        error_result = {
+            "title": "Error",
+            "outline": [],
+            "error": str(e)
+        }
+        
+        write_json(error_result, output_file)
+        
+        return {"pdf_name": pdf_file.name, "output_file": output_file, "error": str(e)}
+
 def main():
     """Main application entry point."""
     logger.info("Starting PDF Outline Extractor (Local Version)")
@@ -34,66 +81,51 @@ def main():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
     # Find all PDF files in input directory
-    pdf_files = list(INPUT_DIR.glob("*.pdf"))
+    pdf_files = [Path(entry.path) for entry in os.scandir(INPUT_DIR)
+                 if entry.is_file() and entry.name.lower().endswith(".pdf")]
     
     if not pdf_files:
-        logger.warning(f"No PDF files found in {INPUT_DIR} directory")
+        logger.warning("No PDF files found in %s directory", INPUT_DIR)
         return
     
-    logger.info(f"Found {len(pdf_files)} PDF file(s) to process")
+    logger.info("Found %d PDF file(s) to process", len(pdf_files))
     
-    # Initialize PDF processor
-    processor = PDFProcessor()
-    
-    # Process each PDF file
-    for pdf_file in pdf_files:
-        try:
-            logger.info(f"Processing: {pdf_file.name}")
-            
-            # Extract outline
-            result = processor.extract_outline(pdf_file)
-            
-            # Generate output filename
-            output_file = OUTPUT_DIR / f"{pdf_file.stem}.json"
+    # Process PDF files in parallel; each file is independent
+    max_workers = min(len(pdf_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        for summary in executor.map(process_one, pdf_files, chunksize=1):
+            pdf_name = summary["pdf_name"]
+            output_file = summary["output_file"]
             
-            # Write JSON output
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            if "error" in summary:
+                logger.error("Error processing %s: %s", pdf_name, summary["error"])
+                continue
             
-            logger.info(f"Successfully processed {pdf_file.name} -> {output_file.name}")
+            result = summary["result"]
+            logger.info("Successfully processed %s -> %s", pdf_name, output_file.name)
             
-            # Print summary
-            print(f"\n{'='*60}")
-            print(f"📄 PROCESSED: {pdf_file.name}")
-            print(f"{'='*60}")
-            print(f"📖 Title: {result['title']}")
-            print(f"📋 Headings found: {len(result['outline'])}")
-            print(f"💾 Output saved to: {output_file}")
+            # Print summary (buffered, written to stdout in one call)
+            buf = io.StringIO()
+            print(f"\n{'='*60}", file=buf)
+            print(f"📄 PROCESSED: {pdf_name}", file=buf)
+            print(f"{'='*60}", file=buf)
+            print(f"📖 Title: {result['title']}", file=buf)
+            print(f"📋 Headings found: {len(result['outline'])}", file=buf)
+            print(f"💾 Output saved to: {output_file}", file=buf)
             
             if result['outline']:
-                print(f"\n📑 Outline Preview:")
+                print(f"\n📑 Outline Preview:", file=buf)
                 for i, heading in enumerate(result['outline'][:10], 1):
                     indent = "  " * (int(heading['level'][1]) - 1)
-                    print(f"{i:2d}. {indent}{heading['level']}: {heading['text']} (page {heading['page']})")
+                    print(f"{i:2d}. {indent}{heading['level']}: {heading['text']} (page {heading['page']})", file=buf)
                 
                 if len(result['outline']) > 10:
-                    print(f"    ... and {len(result['outline']) - 10} more headings")
-            
-            print(f"{'='*60}\n")
-            
-        except Exception as e:
-            logger.error(f"Error processing {pdf_file.name}: {str(e)}")
+                    print(f"    ... and {len(result['outline']) - 10} more headings", file=buf)
             
-            # Create error output
-            error_result = {
-                "title": "Error",
-                "outline": [],
-                "error": str(e)
-            }
+            print(f"{'='*60}\n", file=buf)
             
-            output_file = OUTPUT_DIR / f"{pdf_file.stem}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(error_result, f, indent=2, ensure_ascii=False)
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
     
     logger.info("PDF processing complete")
 
@@ -5,11 +5,17 @@ Shows the entire workflow from build to validation
 """
 
 import subprocess
+import os
 import sys
 import time
-import json
 from pathlib import Path
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from json_io import read_json
+from validate import SolutionValidator
+
 def run_command(cmd, description):
     """Run a command and handle output."""
     print(f"🔧 {description}")
@@ -54,7 +60,10 @@ def main():
     
     # Check for input files
     input_dir = Path("input")
-    pdf_files = list(input_dir.glob("*.pdf"))
+    pdf_files = []
+    if input_dir.is_dir():
+        pdf_files = [Path(entry.path) for entry in os.scandir(input_dir)
+                     if entry.is_file() and entry.name.lower().endswith(".pdf")]
     
     if pdf_files:
         print(f"\n📄 Found {len(pdf_files)} PDF file(s) to process:")
@@ -78,8 +87,7 @@ def main():
                 
                 # Show sample content
                 try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = read_json(json_file)
                     
                     print(f"     Title: {data.get('title', 'N/A')}")
                     print(f"     Headings: {len(data.get('outline', []))}")
@@ -97,9 +105,13 @@ def main():
                 
                 print()
             
-            # Run validation
+            # Run validation in-process rather than spawning another interpreter
             print("🔍 Running output validation...")
-            if run_command("python validate.py", "Validating output format"):
+            validator = SolutionValidator()
+            results = validator.validate_solution(input_dir, output_dir)
+            validator.print_validation_report(results)
+            
+            if results["valid"]:
                 print("✅ All outputs are valid!")
             else:
                 print("⚠️  Some validation issues found - check the report above")
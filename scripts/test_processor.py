@@ -3,8 +3,8 @@
 Test script for PDF Outline Extractor
 """
 
+import os
 import sys
-import json
 import logging
 from pathlib import Path
 
@@ -12,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from pdf_processor import PDFProcessor
+from json_io import write_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -32,7 +33,8 @@ def test_pdf_processor():
     processor = PDFProcessor()
     
     # Look for test PDF files
-    pdf_files = list(test_input.glob("*.pdf"))
+    pdf_files = [Path(entry.path) for entry in os.scandir(test_input)
+                 if entry.is_file() and entry.name.lower().endswith(".pdf")]
     
     if not pdf_files:
         logger.warning("No PDF files found in test_input directory")
@@ -41,17 +43,16 @@ def test_pdf_processor():
     
     for pdf_file in pdf_files:
         try:
-            logger.info(f"Testing with: {pdf_file.name}")
+            logger.info("Testing with: %s", pdf_file.name)
             
             # Extract outline
             result = processor.extract_outline(pdf_file)
             
             # Save result
             output_file = test_output / f"{pdf_file.stem}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            write_json(result, output_file)
             
-            logger.info(f"Result saved to: {output_file}")
+            logger.info("Result saved to: %s", output_file)
             
             # Print summary
             print(f"\n--- {pdf_file.name} ---")
@@ -65,7 +66,7 @@ def test_pdf_processor():
                 print(f"  ... and {len(result['outline']) - 5} more")
             
         except Exception as e:
-            logger.error(f"Error testing {pdf_file.name}: {str(e)}")
+            logger.error("Error testing %s: %s", pdf_file.name, e)
 
 if __name__ == "__main__":
     test_pdf_processor()
@@ -4,13 +4,22 @@ Validation script for PDF Outline Extractor
 Tests the solution against requirements and validates output format.
 """
 
+import io
 import json
 import time
 import logging
 import os
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from json_io import is_packed_outline, read_json, revive_outline
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -25,6 +34,10 @@ class SolutionValidator:
             "required_heading_fields": ["level", "text", "page"],
             "valid_heading_levels": ["H1", "H2", "H3"]
         }
+        
+        # Set views of the requirements for fast membership checks
+        self._required_heading_fields = frozenset(self.requirements["required_heading_fields"])
+        self._valid_heading_levels = frozenset(self.requirements["valid_heading_levels"])
     
     def validate_output_format(self, output_file: Path) -> Dict[str, Any]:
         """
@@ -45,8 +58,7 @@ class SolutionValidator:
         
         try:
             # Load and parse JSON
-            with open(output_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(output_file)
             
             # Check required top-level fields
             for field in self.requirements["required_output_fields"]:
@@ -68,15 +80,21 @@ class SolutionValidator:
                     results["errors"].append("Outline must be a list")
                     results["valid"] = False
                 else:
+                    outline = data["outline"]
+                    
+                    # Outlines written with COMPACT_OUTLINE=1 are packed
+                    if is_packed_outline(outline):
+                        outline = revive_outline(outline)
+                    
                     # Validate each heading
-                    for i, heading in enumerate(data["outline"]):
+                    for i, heading in enumerate(outline):
                         heading_errors = self._validate_heading(heading, i)
                         results["errors"].extend(heading_errors)
                         if heading_errors:
                             results["valid"] = False
                     
                     # Collect statistics
-                    results["stats"] = self._collect_outline_stats(data["outline"])
+                    results["stats"] = self._collect_outline_stats(outline)
             
         except json.JSONDecodeError as e:
             results["errors"].append(f"Invalid JSON format: {str(e)}")
@@ -91,53 +109,51 @@ class SolutionValidator:
         """Validate a single heading object."""
         errors = []
         
-        # Check required fields
-        for field in self.requirements["required_heading_fields"]:
-            if field not in heading:
-                errors.append(f"Heading {index}: Missing required field '{field}'")
+        # Check required fields (set difference on the dict keys runs in C)
+        present = heading.keys() if isinstance(heading, dict) else ()
+        missing = self._required_heading_fields.difference(present)
+        if missing:
+            for field in self.requirements["required_heading_fields"]:
+                if field in missing:
+                    errors.append(f"Heading {index}: Missing required field '{field}'")
         
         # Validate level
-        if "level" in heading:
-            if heading["level"] not in self.requirements["valid_heading_levels"]:
-                errors.append(f"Heading {index}: Invalid level '{heading['level']}'")
+        if "level" not in missing:
+            level = heading["level"]
+            if not isinstance(level, str) or level not in self._valid_heading_levels:
+                errors.append(f"Heading {index}: Invalid level '{level}'")
         
         # Validate text
-        if "text" in heading:
-            if not isinstance(heading["text"], str):
+        if "text" not in missing:
+            text = heading["text"]
+            if not isinstance(text, str):
                 errors.append(f"Heading {index}: Text must be a string")
-            elif len(heading["text"]) == 0:
+            elif len(text) == 0:
                 errors.append(f"Heading {index}: Text cannot be empty")
         
         # Validate page
-        if "page" in heading:
-            if not isinstance(heading["page"], int):
+        if "page" not in missing:
+            page = heading["page"]
+            if not isinstance(page, int):
                 errors.append(f"Heading {index}: Page must be an integer")
-            elif heading["page"] < 1:
+            elif page < 1:
                 errors.append(f"Heading {index}: Page must be positive")
-            elif heading["page"] > self.requirements["max_pages"]:
-                errors.append(f"Heading {index}: Page {heading['page']} exceeds max pages ({self.requirements['max_pages']})")
+            elif page > self.requirements["max_pages"]:
+                errors.append(f"Heading {index}: Page {page} exceeds max pages ({self.requirements['max_pages']})")
         
         return errors
     
     def _collect_outline_stats(self, outline: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Collect statistics about the outline."""
-        stats = {
+        levels = Counter(heading.get("level") for heading in outline)
+        pages = {heading["page"] for heading in outline if isinstance(heading.get("page"), int)}
+        
+        return {
             "total_headings": len(outline),
-            "levels": {"H1": 0, "H2": 0, "H3": 0},
-            "pages_with_headings": set(),
-            "max_page": 0
+            "levels": {level: levels.get(level, 0) for level in ("H1", "H2", "H3")},
+            "pages_with_headings": len(pages),
+            "max_page": max(pages, default=0)
         }
-        
-        for heading in outline:
-            if "level" in heading and heading["level"] in stats["levels"]:
-                stats["levels"][heading["level"]] += 1
-            
-            if "page" in heading:
-                stats["pages_with_headings"].add(heading["page"])
-                stats["max_page"] = max(stats["max_page"], heading["page"])
-        
-        stats["pages_with_headings"] = len(stats["pages_with_headings"])
-        return stats
     
     def validate_solution(self, input_dir: Path, output_dir: Path) -> Dict[str, Any]:
         """
@@ -161,7 +177,10 @@ class SolutionValidator:
         }
         
         # Find all PDF files
-        pdf_files = list(input_dir.glob("*.pdf"))
+        pdf_files = []
+        if input_dir.is_dir():
+            pdf_files = [Path(entry.path) for entry in os.scandir(input_dir)
+                         if entry.is_file() and entry.name.lower().endswith(".pdf")]
         results["total_files"] = len(pdf_files)
         
         if not pdf_files:
@@ -170,6 +189,7 @@ class SolutionValidator:
             return results
         
         # Check each PDF has corresponding output
+        outputs = []
         for pdf_file in pdf_files:
             output_file = output_dir / f"{pdf_file.stem}.json"
             
@@ -179,8 +199,14 @@ class SolutionValidator:
                 results["valid"] = False
                 continue
             
-            # Validate output format
-            file_results = self.validate_output_format(output_file)
+            outputs.append((pdf_file, output_file))
+        
+        # Validate output formats concurrently; the work is dominated by file reads
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            all_file_results = list(executor.map(self.validate_output_format,
+                                                 [output_file for _, output_file in outputs]))
+        
+        for (pdf_file, _), file_results in zip(outputs, all_file_results):
             results["file_results"][pdf_file.name] = file_results
             
             if file_results["valid"]:
@@ -198,50 +224,55 @@ class SolutionValidator:
     
     def print_validation_report(self, results: Dict[str, Any]):
         """Print a formatted validation report."""
-        print("\n" + "="*60)
-        print("📋 PDF OUTLINE EXTRACTOR VALIDATION REPORT")
-        print("="*60)
+        buf = io.StringIO()
+        
+        print("\n" + "="*60, file=buf)
+        print("📋 PDF OUTLINE EXTRACTOR VALIDATION REPORT", file=buf)
+        print("="*60, file=buf)
         
         # Overall status
         status = "✅ PASSED" if results["valid"] else "❌ FAILED"
-        print(f"Overall Status: {status}")
-        print(f"Files Processed: {results['processed_files']}/{results['total_files']}")
+        print(f"Overall Status: {status}", file=buf)
+        print(f"Files Processed: {results['processed_files']}/{results['total_files']}", file=buf)
         
         if results["total_files"] > 0:
             success_rate = results["processed_files"] / results["total_files"] * 100
-            print(f"Success Rate: {success_rate:.1f}%")
+            print(f"Success Rate: {success_rate:.1f}%", file=buf)
         
         # Global errors
         if results["validation_errors"]:
-            print(f"\n🚨 Global Issues ({len(results['validation_errors'])}):")
+            print(f"\n🚨 Global Issues ({len(results['validation_errors'])}):", file=buf)
             for error in results["validation_errors"]:
-                print(f"  • {error}")
+                print(f"  • {error}", file=buf)
         
         # File-specific results
         if results["file_results"]:
-            print(f"\n📄 File-by-File Results:")
+            print(f"\n📄 File-by-File Results:", file=buf)
             for filename, file_result in results["file_results"].items():
                 status = "✅" if file_result["valid"] else "❌"
-                print(f"  {status} {filename}")
+                print(f"  {status} {filename}", file=buf)
                 
                 if file_result["stats"]:
                     stats = file_result["stats"]
-                    print(f"    └─ {stats['total_headings']} headings, {stats['pages_with_headings']} pages")
-                    print(f"       H1: {stats['levels']['H1']}, H2: {stats['levels']['H2']}, H3: {stats['levels']['H3']}")
+                    print(f"    └─ {stats['total_headings']} headings, {stats['pages_with_headings']} pages", file=buf)
+                    print(f"       H1: {stats['levels']['H1']}, H2: {stats['levels']['H2']}, H3: {stats['levels']['H3']}", file=buf)
                 
                 if file_result["errors"]:
-                    print(f"    └─ Errors: {len(file_result['errors'])}")
+                    print(f"    └─ Errors: {len(file_result['errors'])}", file=buf)
                     for error in file_result["errors"][:3]:  # Show first 3 errors
-                        print(f"       • {error}")
+                        print(f"       • {error}", file=buf)
                     if len(file_result["errors"]) > 3:
-                        print(f"       • ... and {len(file_result['errors']) - 3} more")
+                        print(f"       • ... and {len(file_result['errors']) - 3} more", file=buf)
                 
                 if file_result["warnings"]:
-                    print(f"    └─ Warnings: {len(file_result['warnings'])}")
+                    print(f"    └─ Warnings: {len(file_result['warnings'])}", file=buf)
                     for warning in file_result["warnings"][:2]:
-                        print(f"       • {warning}")
+                        print(f"       • {warning}", file=buf)
+        
+        print("\n" + "="*60, file=buf)
         
-        print("\n" + "="*60)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 def main():
     """Main validation function."""
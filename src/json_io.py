@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+JSON I/O - Serialization helpers for outline results
+Uses orjson when it is installed and falls back to the standard json module.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+# Set PRETTY=1 to indent output files for human readers
+_PRETTY = os.environ.get('PRETTY', '') not in ('', '0')
+
+# Set COMPACT_OUTLINE=1 to write outlines in the packed form (see pack_outline)
+COMPACT_OUTLINE = os.environ.get('COMPACT_OUTLINE', '') not in ('', '0')
+
+# Key order of a packed outline
+_OUTLINE_KEYS = ("level", "text", "page")
+
+
+def dumps(data: Any, pretty: Optional[bool] = None) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Output is compact unless pretty-printing is requested.
+
+    Args:
+        data: JSON-serializable object
+        pretty: Indent the output; defaults to the PRETTY environment variable
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if pretty is None:
+        pretty = _PRETTY
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """
+    Parse UTF-8 encoded JSON.
+
+    Args:
+        data: Encoded JSON bytes
+
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+# Binary mode matters on Windows, where os.open defaults to text mode
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def write_json(data: Any, path: Path) -> None:
+    """
+    Write data as JSON to the given path.
+
+    The encoded payload goes straight to the file descriptor, bypassing
+    Python's buffered file objects.
+
+    Args:
+        data: JSON-serializable object
+        path: Output file path
+    """
+    payload = memoryview(dumps(data))
+    fd = os.open(str(path), _WRITE_FLAGS, 0o644)
+    try:
+        while payload:
+            written = os.write(fd, payload)
+            payload = payload[written:]
+    finally:
+        os.close(fd)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse the JSON file at the given path."""
+    return loads(Path(path).read_bytes())
+
+
+def pack_outline(outline: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Pack an outline into a flat homogeneous-collection (JSONH) list.
+
+    The keys are written once instead of once per heading:
+    [3, "level", "text", "page", "H1", "Intro", 1, "H2", "Background", 2, ...]
+
+    Args:
+        outline: List of heading dictionaries
+
+    Returns:
+        Packed outline list
+    """
+    packed = [len(_OUTLINE_KEYS), *_OUTLINE_KEYS]
+    for heading in outline:
+        packed.extend(heading[key] for key in _OUTLINE_KEYS)
+    return packed
+
+
+def is_packed_outline(outline: List[Any]) -> bool:
+    """Check whether an outline list is in the packed form."""
+    return bool(outline) and type(outline[0]) is int
+
+
+def revive_outline(packed: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Expand a packed outline back into a list of heading dictionaries.
+
+    Args:
+        packed: Outline produced by pack_outline
+
+    Returns:
+        List of heading dictionaries
+    """
+    key_count = packed[0]
+    keys = packed[1:1 + key_count]
+    return [
+        dict(zip(keys, packed[i:i + key_count]))
+        for i in range(1 + key_count, len(packed), key_count)
+    ]
+
+
+def pack_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of an extraction result with its outline packed."""
+    return {**result, "outline": pack_outline(result["outline"])}
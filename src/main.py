@@ -5,12 +5,13 @@ Extracts structured document outlines from PDF files.
 """
 
 import os
-import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
 from pdf_processor import PDFProcessor
+from json_io import COMPACT_OUTLINE, pack_result, write_json
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +23,49 @@ logger = logging.getLogger(__name__)
 INPUT_DIR = Path("/app/input")
 OUTPUT_DIR = Path("/app/output")
 
+# PDF processor reused by every task in a worker process (set by _init_worker)
+_PROCESSOR = None
+
+def _init_worker():
+    """Create the worker process's PDF processor once, before it runs any tasks."""
+    global _PROCESSOR
+    _PROCESSOR = PDFProcessor()
+
+def process_one(pdf_file: Path) -> Dict[str, Any]:
+    """
+    Extract the outline of a single PDF and write its JSON output.
+    
+    Runs in a worker process; the returned summary is reported by the parent.
+    
+    Args:
+        pdf_file: Path to PDF file
+        
+    Returns:
+        Summary dictionary with the output path and, on failure, the error
+    """
+    output_file = OUTPUT_DIR / f"{pdf_file.stem}.json"
+    
+    try:
+        # Extract outline
+        result = _PROCESSOR.extract_outline(pdf_file)
+        
+        # Write JSON output
+        write_json(pack_result(result) if COMPACT_OUTLINE else result, output_file)
+        
+        return {"pdf_name": pdf_file.name, "output_file": output_file}
+        
+    except Exception as e:
+        # Create error output
+        error_result = {
+            "title": "Error",
+            "outline": [],
+            "error": str(e)
+        }
+        
+        write_json(error_result, output_file)
+        
+        return {"pdf_name": pdf_file.name, "output_file": output_file, "error": str(e)}
+
 def main():
     """Main application entry point."""
     logger.info("Starting PDF Outline Extractor")
@@ -31,47 +75,23 @@ def main():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
     # Find all PDF files in input directory
-    pdf_files = list(INPUT_DIR.glob("*.pdf"))
+    pdf_files = [Path(entry.path) for entry in os.scandir(INPUT_DIR)
+                 if entry.is_file() and entry.name.lower().endswith(".pdf")]
     
     if not pdf_files:
         logger.warning("No PDF files found in /app/input directory")
         return
     
-    logger.info(f"Found {len(pdf_files)} PDF file(s) to process")
-    
-    # Initialize PDF processor
-    processor = PDFProcessor()
+    logger.info("Found %d PDF file(s) to process", len(pdf_files))
     
-    # Process each PDF file
-    for pdf_file in pdf_files:
-        try:
-            logger.info(f"Processing: {pdf_file.name}")
-            
-            # Extract outline
-            result = processor.extract_outline(pdf_file)
-            
-            # Generate output filename
-            output_file = OUTPUT_DIR / f"{pdf_file.stem}.json"
-            
-            # Write JSON output
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Successfully processed {pdf_file.name} -> {output_file.name}")
-            
-        except Exception as e:
-            logger.error(f"Error processing {pdf_file.name}: {str(e)}")
-            
-            # Create error output
-            error_result = {
-                "title": "Error",
-                "outline": [],
-                "error": str(e)
-            }
-            
-            output_file = OUTPUT_DIR / f"{pdf_file.stem}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(error_result, f, indent=2, ensure_ascii=False)
+    # Process PDF files in parallel; each file is independent
+    max_workers = min(len(pdf_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        for summary in executor.map(process_one, pdf_files, chunksize=1):
+            if "error" in summary:
+                logger.error("Error processing %s: %s", summary["pdf_name"], summary["error"])
+            else:
+                logger.info("Successfully processed %s -> %s", summary["pdf_name"], summary["output_file"].name)
     
     logger.info("PDF processing complete")
 
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Outline Cache - On-disk memoization of extracted outlines
+Lets repeated runs over the same input files skip PDF parsing entirely.
+"""
+
+import hashlib
+import inspect
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Any
+
+from json_io import read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+# Number of leading bytes of each PDF mixed into the cache key
+_HEAD_BYTES = 65536
+
+
+class OutlineCache:
+    """Wraps a PDFProcessor and caches its extract_outline results on disk."""
+
+    def __init__(self, processor, cache_dir: Path = Path(".outline_cache")):
+        """
+        Initialize the cache.
+
+        Args:
+            processor: PDFProcessor used on cache misses
+            cache_dir: Directory holding cached outline JSON files
+        """
+        self.processor = processor
+        self.cache_dir = Path(cache_dir)
+
+        # Fingerprint the processor source so heuristic changes invalidate old entries
+        source = Path(inspect.getsourcefile(type(processor))).read_bytes()
+        self._fingerprint = hashlib.blake2b(source, digest_size=16).digest()
+
+    def _cache_key(self, pdf_path: Path) -> str:
+        """
+        Build the cache key for a PDF file.
+
+        The key covers the file name (some outputs depend on it), size,
+        modification time and the first 64KB of content.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Hex digest identifying the file and processor version
+        """
+        st = pdf_path.stat()
+        digest = hashlib.blake2b(self._fingerprint, digest_size=16)
+
+        with open(pdf_path, 'rb') as f:
+            digest.update(f.read(_HEAD_BYTES))
+
+        digest.update(f"{pdf_path.name}:{st.st_size}:{st.st_mtime_ns}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def extract_outline(self, pdf_path: Path) -> Dict[str, Any]:
+        """
+        Extract structured outline from PDF file, reusing a cached result if present.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Dictionary containing title and outline structure
+        """
+        cache_file = self.cache_dir / f"{self._cache_key(pdf_path)}.json"
+
+        try:
+            return read_json(cache_file)
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            logger.warning("Ignoring corrupt cache entry %s: %s", cache_file, e)
+
+        result = self.processor.extract_outline(pdf_path)
+        self._store(cache_file, result)
+        return result
+
+    def _store(self, cache_file: Path, result: Dict[str, Any]):
+        """Atomically write a result to the cache (write to a temp file, then rename)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            write_json(result, tmp_file)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning("Could not write cache entry %s: %s", cache_file, e)
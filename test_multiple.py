@@ -1,10 +1,14 @@
+import sys
 from src.pdf_processor import PDFProcessor
+from src.json_io import dumps
 from pathlib import Path
 
-processor = PDFProcessor()
-files = ['file01.pdf', 'file02.pdf', 'file03.pdf']
+if __name__ == '__main__':
+    processor = PDFProcessor()
+    files = ['file01.pdf', 'file02.pdf', 'file03.pdf']
 
-for f in files:
-    result = processor.extract_outline(Path(f'input/{f}'))
-    print(f'{f}: {result}')
-    print()
+    # Files are processed in parallel worker processes; results keep input order.
+    # Each result is written as one JSON line.
+    for f, result in processor.extract_outline_batch([Path(f'input/{f}') for f in files]):
+        sys.stdout.buffer.write(dumps({"file": f, "result": result}) + b"\n")
+    sys.stdout.buffer.flush()